@@ -15,102 +15,251 @@ Output:
 - Waypoint KML files for DJI missions (in output_paths/)
 """
 
+import argparse
+import contextlib
+import functools
+import io
 import os
 import sys
-import xml.etree.ElementTree as ET
+import zipfile
 import simplekml
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html.parser import HTMLParser
+from itertools import repeat
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Prefer lxml (libxml2, C) for parsing; fall back to the stdlib ElementTree
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+KML_NAMESPACE = 'http://www.opengis.net/kml/2.2'
+
+# (longitude, latitude, altitude)
+Point = Tuple[float, float, float]
+
+# Placemark child tags (namespaced or plain) mapped to the field they hold
+PLACEMARK_FIELD_TAGS = {
+    tag: field
+    for field in ('coordinates', 'name', 'description')
+    for tag in (f"{{{KML_NAMESPACE}}}{field}", field)
+}
+
+# Name cleanup: special characters, then runs of whitespace, become underscores.
+# Names are cleaned in batches joined on NAME_SEPARATOR (NUL cannot occur in
+# XML text), so CLEAN_CHARS_RE leaves it alone (see clean_names).
+NAME_SEPARATOR = '\x00'
+CLEAN_CHARS_RE = re.compile(r'[^\w\-_\s\x00]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Start of the first table row, matched case-insensitively like the HTML parser
+TABLE_ROW_START_RE = re.compile(r'<tr', re.IGNORECASE)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# DJI mission KML, matching the working format exactly. Only the mission
+# name and the base/target coordinates change between files.
+KML_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2" xmlns:kml="http://www.opengis.net/kml/2.2" xmlns:atom="http://www.w3.org/2005/Atom">
+<Document>
+	<name>{clean_name}.kml</name>
+	<StyleMap id="m_ylw-pushpin">
+		<Pair>
+			<key>normal</key>
+			<styleUrl>#s_ylw-pushpin</styleUrl>
+		</Pair>
+		<Pair>
+			<key>highlight</key>
+			<styleUrl>#s_ylw-pushpin_hl</styleUrl>
+		</Pair>
+	</StyleMap>
+	<Style id="s_ylw-pushpin">
+		<IconStyle>
+			<scale>1.1</scale>
+			<Icon>
+				<href>http://maps.google.com/mapfiles/kml/pushpin/ylw-pushpin.png</href>
+			</Icon>
+			<hotSpot x="20" y="2" xunits="pixels" yunits="pixels"/>
+		</IconStyle>
+	</Style>
+	<Style id="s_ylw-pushpin_hl">
+		<IconStyle>
+			<scale>1.3</scale>
+			<Icon>
+				<href>http://maps.google.com/mapfiles/kml/pushpin/ylw-pushpin.png</href>
+			</Icon>
+			<hotSpot x="20" y="2" xunits="pixels" yunits="pixels"/>
+		</IconStyle>
+	</Style>
+	<Placemark>
+		<name>{clean_name}</name>
+		<styleUrl>#m_ylw-pushpin</styleUrl>
+		<LineString>
+			<tessellate>1</tessellate>
+			<coordinates>
+				{coords} 
+			</coordinates>
+		</LineString>
+		<atom:link rel="app" href="https://www.google.com/earth/about/versions/#earth-pro" title="Google Earth Pro 7.3.6.10201"></atom:link>
+	</Placemark>
+</Document>
+</kml>'''
+
+# KML_TEMPLATE pre-split around its placeholders ({clean_name} twice, then
+# {coords}) into UTF-8 chunks, so rendering is a single bytes join
+TEMPLATE_PLACEHOLDER_RE = re.compile(r'\{clean_name\}|\{coords\}')
+KML_CHUNKS = tuple(chunk.encode('utf-8') for chunk in TEMPLATE_PLACEHOLDER_RE.split(KML_TEMPLATE))
+
+
+class _HeaderCellFound(Exception):
+    """Raised by TableHeaderCellParser to stop feeding once the cell is read."""
+
+
+class TableHeaderCellParser(HTMLParser):
+    """
+    Single-pass scanner that finds the first <td> following the first <tr>
+    with a background colour (the table header row) and captures the cell's
+    raw HTML exactly as written, from the end of <td ...> up to </td>.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.in_header_row = False
+        self.in_cell = False
+        self.cell_start = 0
+        self.cell_html = None
+        self.line_offsets = [0]
+    
+    def feed(self, data):
+        # getpos() reports (line, column); keep line start offsets so they
+        # can be mapped back to positions in the fed text
+        self.line_offsets = [0]
+        newline = data.find('\n')
+        while newline >= 0:
+            self.line_offsets.append(newline + 1)
+            newline = data.find('\n', newline + 1)
+        super().feed(data)
+    
+    def _offset(self):
+        """Offset in the fed text of the tag currently being handled."""
+        lineno, column = self.getpos()
+        return self.line_offsets[lineno - 1] + column
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr' and not self.in_header_row:
+            self.in_header_row = any(
+                'background' in name or (value and 'background' in value.lower())
+                for name, value in attrs
+            )
+        elif tag == 'td' and self.in_header_row and not self.in_cell:
+            self.in_cell = True
+            self.cell_start = self._offset() + len(self.get_starttag_text())
+    
+    def handle_endtag(self, tag):
+        if tag == 'td' and self.in_cell:
+            self.cell_html = self.rawdata[self.cell_start:self._offset()]
+            raise _HeaderCellFound
 
 
 class KMLPointProcessor:
-    def __init__(self, base_dir):
+    def __init__(self, base_dir: Union[str, Path], archive: bool = False) -> None:
         self.base_dir = Path(base_dir)
         self.base_kml_dir = self.base_dir / "base_kml"
         self.input_points_kml_dir = self.base_dir / "input_points_kml"
         self.output_paths_dir = self.base_dir / "output_paths"
+        # When set, missions are written into a single zip instead of loose files
+        self.archive = archive
+        self.archive_path = self.output_paths_dir / "missions.zip"
         
         # Ensure output directory exists
         self.output_paths_dir.mkdir(exist_ok=True)
         
-    def parse_kml_point(self, kml_file_path):
+    def _iter_kml_elements(self, kml_file_path, local_name):
+        """
+        Stream a KML file and yield each element named local_name (with or
+        without the KML namespace) as soon as its closing tag is parsed.
+        """
+        tags = (f"{{{KML_NAMESPACE}}}{local_name}", local_name)
+        if HAS_LXML:
+            # libxml2 filters tags and drops whitespace-only text nodes
+            for _, elem in ET.iterparse(str(kml_file_path), events=('end',), tag=tags,
+                                        remove_blank_text=True, huge_tree=False):
+                yield elem
+        else:
+            for _, elem in ET.iterparse(str(kml_file_path), events=('end',)):
+                if elem.tag in tags:
+                    yield elem
+        
+    def parse_kml_point(self, kml_file_path: Union[str, Path]) -> Optional[Point]:
         """
         Parse a KML file and extract the first point coordinates.
         Returns (longitude, latitude, altitude) or None if no point found.
         """
         try:
-            tree = ET.parse(kml_file_path)
-            root = tree.getroot()
-            
-            # Handle KML namespace
-            namespace = {'kml': 'http://www.opengis.net/kml/2.2'}
-            
-            # Find coordinates in the KML
-            coordinates_elem = root.find('.//kml:coordinates', namespace)
-            if coordinates_elem is None:
-                # Try without namespace (some KML files don't use it)
-                coordinates_elem = root.find('.//coordinates')
+            # Stream the file instead of building the whole tree, keeping the
+            # first <coordinates> element. Matches both namespaced and plain
+            # tags (some KML files don't use the namespace). The rest of the
+            # file is still read so that malformed XML is rejected.
+            coords_text = None
+            for elem in self._iter_kml_elements(kml_file_path, 'coordinates'):
+                if coords_text is None:
+                    coords_text = elem.text or ''
+                elem.clear()
             
-            if coordinates_elem is not None and coordinates_elem.text:
-                # Parse coordinates (format: lon,lat,alt or lon,lat)
-                coords_text = coordinates_elem.text.strip()
-                coords = coords_text.split(',')
-                
-                if len(coords) >= 2:
-                    lon = float(coords[0])
-                    lat = float(coords[1])
-                    alt = float(coords[2]) if len(coords) > 2 else 0.0
-                    return (lon, lat, alt)
+            if coords_text:
+                return self.parse_coordinates(coords_text.strip())
                     
         except Exception as e:
             print(f"Error parsing KML file {kml_file_path}: {e}")
             
         return None
     
-    def parse_all_kml_points(self, kml_file_path):
+    def parse_coordinates(self, coords_text: str) -> Optional[Point]:
+        """
+        Parse a coordinate string (format: lon,lat,alt or lon,lat).
+        Returns (longitude, latitude, altitude) or None if fewer than two values.
+        """
+        coords = coords_text.split(',')
+        
+        if len(coords) >= 2:
+            lon = float(coords[0])
+            lat = float(coords[1])
+            alt = float(coords[2]) if len(coords) > 2 else 0.0
+            return (lon, lat, alt)
+            
+        return None
+    
+    def parse_all_kml_points(self, kml_file_path: Union[str, Path]) -> List[Dict[str, Any]]:
         """
         Parse a KML file and extract all placemarks with their points and descriptions.
         Returns a list of dictionaries with point data.
         """
-        points = []
+        points: List[Dict[str, Any]] = []
         try:
-            tree = ET.parse(kml_file_path)
-            root = tree.getroot()
-            
-            # Handle KML namespace
-            namespace = {'kml': 'http://www.opengis.net/kml/2.2'}
-            
-            # Find all placemarks
-            placemarks = root.findall('.//kml:Placemark', namespace)
-            if not placemarks:
-                # Try without namespace
-                placemarks = root.findall('.//Placemark')
-            
-            for i, placemark in enumerate(placemarks):
-                # Get coordinates
-                coordinates_elem = placemark.find('.//kml:coordinates', namespace)
-                if coordinates_elem is None:
-                    coordinates_elem = placemark.find('.//coordinates')
+            # Visit each placemark once as it is parsed and pick out the first
+            # coordinates/name/description in a single walk of its subtree
+            for i, placemark in enumerate(self._iter_kml_elements(kml_file_path, 'Placemark')):
+                found = {}
+                for child in placemark.iter():
+                    field = PLACEMARK_FIELD_TAGS.get(child.tag)
+                    if field is not None and field not in found:
+                        found[field] = child
+                coordinates_elem = found.get('coordinates')
+                name_elem = found.get('name')
+                desc_elem = found.get('description')
                 
                 if coordinates_elem is not None and coordinates_elem.text:
-                    coords_text = coordinates_elem.text.strip()
-                    coords = coords_text.split(',')
+                    coordinates = self.parse_coordinates(coordinates_elem.text.strip())
                     
-                    if len(coords) >= 2:
-                        lon = float(coords[0])
-                        lat = float(coords[1])
-                        alt = float(coords[2]) if len(coords) > 2 else 0.0
-                        
+                    if coordinates is not None:
                         # Get placemark name
-                        name_elem = placemark.find('.//kml:name', namespace)
-                        if name_elem is None:
-                            name_elem = placemark.find('.//name')
                         name = name_elem.text if name_elem is not None and name_elem.text else f"Point_{i+1}"
                         
                         # Get description for HTML table extraction
-                        desc_elem = placemark.find('.//kml:description', namespace)
-                        if desc_elem is None:
-                            desc_elem = placemark.find('.//description')
                         description = desc_elem.text if desc_elem is not None and desc_elem.text else ""
                         
                         # Extract table attribute from description
@@ -118,35 +267,56 @@ class KMLPointProcessor:
                         
                         points.append({
                             'name': name,
-                            'coordinates': (lon, lat, alt),
+                            'coordinates': coordinates,
                             'description': description,
                             'table_attribute': table_attribute
                         })
+                
+                # Release the subtree now that it has been read
+                placemark.clear()
                         
+        except ET.ParseError as e:
+            # Malformed XML fails the whole file, as a full-tree parse would
+            print(f"Error parsing KML file {kml_file_path}: {e}")
+            return []
         except Exception as e:
             print(f"Error parsing KML file {kml_file_path}: {e}")
             
         return points
     
-    def extract_html_table_attribute_from_text(self, html_text):
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def extract_html_table_attribute_from_text(html_text: str) -> Optional[str]:
         """
         Extract the first cell content from the first HTML table in the given text.
         Returns the attribute string or None if not found.
+        Results are cached, as exports often repeat the same description.
         """
         try:
             if not html_text:
                 return None
-                
-            # Use regex to find the first table cell content in the header row
-            # Look for the first <td> inside a <tr> with background color (header row)
-            table_pattern = r'<tr[^>]*background[^>]*>.*?<td[^>]*>(.*?)</td>'
-            match = re.search(table_pattern, html_text, re.DOTALL | re.IGNORECASE)
             
-            if match:
+            # Most descriptions have no header table at all; a substring
+            # check is far cheaper than running the HTML parser over them
+            lowered = html_text.lower()
+            if '<td' not in lowered or 'background' not in lowered:
+                return None
+            # Offset is found on the original text: lower() can change its length
+            row_match = TABLE_ROW_START_RE.search(html_text)
+            if row_match is None:
+                return None
+                
+            # Scan the HTML once for the first <td> inside a <tr> with
+            # background color (header row), stopping as soon as it closes.
+            # Nothing before the first <tr> can match, so skip the preamble.
+            parser = TableHeaderCellParser()
+            try:
+                parser.feed(html_text[row_match.start():])
+            except _HeaderCellFound:
                 # Clean up the content (remove HTML tags, whitespace)
-                attribute = match.group(1).strip()
+                attribute = parser.cell_html.strip()
                 # Remove any remaining HTML tags
-                attribute = re.sub(r'<[^>]+>', '', attribute).strip()
+                attribute = HTML_TAG_RE.sub('', attribute).strip()
                 return attribute if attribute else None
                 
         except Exception as e:
@@ -180,78 +350,114 @@ class KMLPointProcessor:
             print(f"Warning: Input points directory not found: {self.input_points_kml_dir}")
             return destination_points
             
-        for kml_file in sorted(self.input_points_kml_dir.glob("*.kml")):
-            print(f"Processing {kml_file.name}...")
-            points = self.parse_all_kml_points(kml_file)
+        # scandir entries carry their file type from the directory listing,
+        # so filtering needs no extra stat calls; parsers take the str paths
+        # Match and order names as glob("*.kml") and sorted() on Paths did:
+        # case-insensitive on Windows, hidden files skipped
+        with os.scandir(self.input_points_kml_dir) as entries:
+            kml_entries = sorted(
+                (entry for entry in entries
+                 if os.path.normcase(entry.name).endswith('.kml')
+                 and not entry.name.startswith('.') and entry.is_file()),
+                key=lambda entry: os.path.normcase(entry.name)
+            )
+        kml_files = [entry.path for entry in kml_entries]
+        
+        parsed_files = None
+        if len(kml_files) > 1:
+            # Files are independent and parsing is CPU-bound, so spread them
+            # across processes; map() keeps results in input order
+            workers = min(len(kml_files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed_files = list(executor.map(_parse_all_kml_points_worker, repeat(self.base_dir), kml_files))
+            
+        for i, entry in enumerate(kml_entries):
+            print(f"Processing {entry.name}...")
+            if parsed_files is None:
+                points = self.parse_all_kml_points(entry.path)
+            else:
+                # Worker messages (e.g. parse errors) go under their file's header
+                points, messages = parsed_files[i]
+                print(messages, end='')
+            kml_path = Path(entry.path)
             
             for point_data in points:
                 destination_points.append({
-                    'filename': kml_file.stem,
+                    'filename': kml_path.stem,
                     'name': point_data['name'],
                     'coordinates': point_data['coordinates'],
                     'table_attribute': point_data['table_attribute'],
-                    'kml_path': kml_file
+                    'kml_path': kml_path
                 })
                 
         return destination_points
     
-    def create_dji_mission_kml(self, base_point, target_point, mission_name):
+    def format_coordinates(self, point: Point) -> str:
         """
-        Create a DJI mission-compatible KML file with waypoints from base to target.
-        Uses the format that works with DJI software - manually constructed XML.
+        Format a (longitude, latitude, altitude) tuple as a KML coordinate string.
         """
-        # Clean the mission name for filename and XML
-        clean_name = re.sub(r'[^\w\-_\s]', '_', mission_name)
-        clean_name = re.sub(r'\s+', '_', clean_name.strip())
-        
-        # Create the KML content manually to match the working format exactly
-        kml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2" xmlns:kml="http://www.opengis.net/kml/2.2" xmlns:atom="http://www.w3.org/2005/Atom">
-<Document>
-	<name>{clean_name}.kml</name>
-	<StyleMap id="m_ylw-pushpin">
-		<Pair>
-			<key>normal</key>
-			<styleUrl>#s_ylw-pushpin</styleUrl>
-		</Pair>
-		<Pair>
-			<key>highlight</key>
-			<styleUrl>#s_ylw-pushpin_hl</styleUrl>
-		</Pair>
-	</StyleMap>
-	<Style id="s_ylw-pushpin">
-		<IconStyle>
-			<scale>1.1</scale>
-			<Icon>
-				<href>http://maps.google.com/mapfiles/kml/pushpin/ylw-pushpin.png</href>
-			</Icon>
-			<hotSpot x="20" y="2" xunits="pixels" yunits="pixels"/>
-		</IconStyle>
-	</Style>
-	<Style id="s_ylw-pushpin_hl">
-		<IconStyle>
-			<scale>1.3</scale>
-			<Icon>
-				<href>http://maps.google.com/mapfiles/kml/pushpin/ylw-pushpin.png</href>
-			</Icon>
-			<hotSpot x="20" y="2" xunits="pixels" yunits="pixels"/>
-		</IconStyle>
-	</Style>
-	<Placemark>
-		<name>{clean_name}</name>
-		<styleUrl>#m_ylw-pushpin</styleUrl>
-		<LineString>
-			<tessellate>1</tessellate>
-			<coordinates>
-				{base_point[0]},{base_point[1]},{base_point[2]} {target_point[0]},{target_point[1]},{target_point[2]} 
-			</coordinates>
-		</LineString>
-		<atom:link rel="app" href="https://www.google.com/earth/about/versions/#earth-pro" title="Google Earth Pro 7.3.6.10201"></atom:link>
-	</Placemark>
-</Document>
-</kml>'''
+        return f"{point[0]},{point[1]},{point[2]}"
+    
+    def clean_names(self, names: List[str]) -> List[str]:
+        """
+        Clean names for use in filenames and XML: special characters become
+        underscores, then each name is trimmed and runs of whitespace become
+        underscores. The whole batch goes through each regex once.
+        """
+        if not names:
+            return []
         
-        return kml_content
+        if any(NAME_SEPARATOR in name for name in names):
+            # The separator would split a name in two; clean one at a time,
+            # treating the separator as any other special character
+            return [
+                WHITESPACE_RE.sub('_', CLEAN_CHARS_RE.sub('_', name).replace(NAME_SEPARATOR, '_').strip())
+                for name in names
+            ]
+            
+        cleaned = CLEAN_CHARS_RE.sub('_', NAME_SEPARATOR.join(names))
+        trimmed = NAME_SEPARATOR.join(name.strip() for name in cleaned.split(NAME_SEPARATOR))
+        return WHITESPACE_RE.sub('_', trimmed).split(NAME_SEPARATOR)
+    
+    def render_mission_chunks(self, base_str: str, target_str: str, clean_name: str) -> Tuple[bytes, ...]:
+        """
+        Render a DJI mission-compatible KML file with waypoints from base to target
+        as the UTF-8 chunks that make up the file, ready for a gather write.
+        base_str and target_str are pre-formatted coordinates (see format_coordinates).
+        clean_name must already be cleaned (see clean_names).
+        """
+        # Fill in the static template (see KML_TEMPLATE)
+        head, after_document_name, after_placemark_name, tail = KML_CHUNKS
+        name_bytes = clean_name.encode('utf-8')
+        return (
+            head, name_bytes,
+            after_document_name, name_bytes,
+            after_placemark_name, f"{base_str} {target_str}".encode('utf-8'),
+            tail,
+        )
+    
+    def write_mission_file(self, mission_file):
+        """
+        Write one (output_file, kml_chunks) pair to disk.
+        Returns the output file path.
+        """
+        output_file, kml_chunks = mission_file
+        # Raw fd and one gather write (writev) per file: no Python file object
+        # and no joined copy of the content. O_BINARY stops newline translation on Windows.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(output_file, flags, 0o666)
+        try:
+            if hasattr(os, 'writev'):
+                written = os.writev(fd, kml_chunks)
+                remaining = b''.join(kml_chunks)[written:] if written < sum(map(len, kml_chunks)) else b''
+            else:
+                remaining = b''.join(kml_chunks)
+            while remaining:
+                written = os.write(fd, remaining)
+                remaining = remaining[written:]
+        finally:
+            os.close(fd)
+        return output_file
     
     def process_all_points(self):
         """
@@ -278,11 +484,25 @@ class KMLPointProcessor:
             
             # Create mission KML files with numbered filenames
             print("\nCreating DJI mission files...")
+            # The base point is the same for every mission, so format it once
+            base_str = self.format_coordinates(base_point)
+            target_strs = [self.format_coordinates(point_data['coordinates']) for point_data in destination_points]
+            
+            # Clean all mission names and table attributes in one batch
+            point_count = len(destination_points)
+            clean_values = self.clean_names(
+                [point_data['name'] for point_data in destination_points] +
+                [point_data['table_attribute'] or '' for point_data in destination_points]
+            )
+            clean_names = clean_values[:point_count]
+            clean_attributes = clean_values[point_count:]
+            
+            mission_files = []
             for i, point_data in enumerate(destination_points, 1):
-                kml_content = self.create_dji_mission_kml(
-                    base_point, 
-                    point_data['coordinates'], 
-                    point_data['name']
+                kml_chunks = self.render_mission_chunks(
+                    base_str, 
+                    target_strs[i - 1], 
+                    clean_names[i - 1]
                 )
                 
                 # Generate filename with leading zeros and table attribute
@@ -291,19 +511,25 @@ class KMLPointProcessor:
                 # Build filename components
                 filename_parts = [file_number]
                 if point_data['table_attribute']:
-                    # Clean the attribute for use in filename (remove special characters)
-                    clean_attribute = re.sub(r'[^\w\-_\s]', '_', point_data['table_attribute'])
-                    clean_attribute = re.sub(r'\s+', '_', clean_attribute.strip())  # Replace spaces with underscores
-                    filename_parts.append(clean_attribute)
+                    # Attribute cleaned for use in filename (special characters and spaces replaced)
+                    filename_parts.append(clean_attributes[i - 1])
                 
                 filename = "_".join(filename_parts) + ".kml"
-                output_file = self.output_paths_dir / filename
-                
-                # Write the KML content directly to file
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(kml_content)
-                    
-                print(f"Created: {output_file}")
+                mission_files.append((self.output_paths_dir / filename, kml_chunks))
+            
+            if self.archive:
+                # One sequential zip write instead of many small files;
+                # level 1 keeps CPU cost low while the repeated template compresses well
+                with zipfile.ZipFile(self.archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                    for output_file, kml_chunks in mission_files:
+                        zf.writestr(output_file.name, b''.join(kml_chunks))
+                        print(f"Added: {output_file.name}")
+                print(f"Created: {self.archive_path}")
+            else:
+                # Writes are I/O-bound and release the GIL, so use threads
+                with ThreadPoolExecutor() as executor:
+                    for output_file in executor.map(self.write_mission_file, mission_files):
+                        print(f"Created: {output_file}")
             
             print(f"\nProcessing complete! Created {len(destination_points)} mission files.")
             
@@ -312,10 +538,31 @@ class KMLPointProcessor:
             sys.exit(1)
 
 
+def _parse_all_kml_points_worker(base_dir, kml_file_path):
+    """
+    Process pool entry point. Builds a processor in the worker rather than
+    pickling one, which compiled (mypyc) classes do not support.
+    Returns the points and anything printed while parsing, so the parent can
+    print it in file order.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        points = KMLPointProcessor(base_dir).parse_all_kml_points(kml_file_path)
+    return points, output.getvalue()
+
+
 def main():
     """Main entry point of the script."""
+    parser = argparse.ArgumentParser(description="Convert KML points into DJI mission waypoint KML files.")
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="write all missions into output_paths/missions.zip instead of separate files",
+    )
+    args = parser.parse_args()
+    
     script_dir = Path(__file__).parent
-    processor = KMLPointProcessor(script_dir)
+    processor = KMLPointProcessor(script_dir, archive=args.archive)
     processor.process_all_points()
 
 